@@ -1,18 +1,419 @@
 import React, { useState, useRef, useEffect } from 'react';
 import './App.css';
 
+// Fixed values for the API call
+const CHAT_API_URL = 'https://lntcs.ai/chatservice/chat';
+const SPACE_NAME = "Insurance_usecase";
+const EXTRACTION_HINT = "Act as an expert attorney specializing in insurance clauses for large-scale construction projects. You have extensive experience in analyzing tender documents and policy documents to extract relevant insurance obligations.Instructions:Extract clauses only related to the above categories.The extracted text should be directly from the tender or policy document.If summarization is needed!, provide a context-based summarization without altering the legal meaning.";
+
+// Get bearer token from CanvasAI
+const BEARER_TOKEN = "eyJhbGciOiJSUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6ICIyNzJza204SEFYVEl1MWgwNThyZUliVVJILWhLTEE5OElFOHdqMDlyXzJNIn0.eyJleHAiOjE3NDEwNzM1ODMsImlhdCI6MTc0MTA3MjA4MywiYXV0aF90aW1lIjoxNzQxMDY5MTkyLCJqdGkiOiI2NzEyYjFhNy1mMzBmLTQyMmQtOTFhNS1hY2VjMzFjMWE4MzYiLCJpc3MiOiJodHRwczovL2xudGNzLmFpL2tleWNsb2FrL3JlYWxtcy9jYW52YXNhaSIsImF1ZCI6ImJyb2tlciIsInN1YiI6ImQwNTkxZDg4LWUyYTEtNGE1OC1hODYxLWNiMTRjZTQ3NjJiZiIsInR5cCI6IkJlYXJlciIsImF6cCI6ImNhbnZhc2FpLWNvbnRyb2xwbGFuZS11aSIsIm5vbmNlIjoiODNhZDZiNWYtNDY4NC00NTA2LThhNGQtZmU2MmJjNjI5ZjYxIiwic2Vzc2lvbl9zdGF0ZSI6IjhhMjBmN2FjLWUyOTgtNDg4Ni1iMjZhLWVjNmE5NWNmNjE3ZCIsImFjciI6IjEiLCJhbGxvd2VkLW9yaWdpbnMiOlsiKiIsImh0dHBzOi8vbG50Y3MuYWkvc3R1ZGlvIl0sInJlc291cmNlX2FjY2VzcyI6eyJicm9rZXIiOnsicm9sZXMiOlsicmVhZC10b2tlbiJdfX0sInNjb3BlIjoib3BlbmlkIGVtYWlsIEdyb3VwU2NvcGUgcHJvZmlsZSIsInNpZCI6IjhhMjBmN2FjLWUyOTgtNDg4Ni1iMjZhLWVjNmE5NWNmNjE3ZCIsInVwbiI6ImVmZDI4MWFhLTUyM2EtNDhjNS1iZjY3LWE5ZmQzYTQ4ZmZiYiIsImVtYWlsX3ZlcmlmaWVkIjp0cnVlLCJuYW1lIjoiQW5hcyBTYWhlYiIsImdyb3VwcyI6WyIvY2FudmFzYWktYWRtaW4iLCIvY2FudmFzYWktY3JlYXRvciJdLCJwcmVmZXJyZWRfdXNlcm5hbWUiOiJlZmQyODFhYS01MjNhLTQ4YzUtYmY2Ny1hOWZkM2E0OGZmYmIiLCJnaXZlbl9uYW1lIjoiQW5hcyIsImZhbWlseV9uYW1lIjoiU2FoZWIiLCJlbWFpbCI6ImFuYXMuc2FoZWItY250QGxudGVjYy5jb20ifQ.OgbldflbcGQdrUC-cYw3sRUQDxpvSY4oLtRhOwguC5PlCHgF04Kw7u6WMD0fVGdfqT2IVdbdhmffhptsp7F9WsxXwB2Ryiygwyg4kEwEuwyFcMvI4r1ByQWCCxCiVmTeGYtWzdmmfabti8Q0NppOkya2Z6WP_BLLypj3tKdJRCuLjWsSsk1lhnKSM_FXBu0t-lxw8a5_XBzFrjmLezFbu2vK7QMomMH2jUCCNHGY9Cd7wSCwUMEjojXmQWZcksInD8CiZJmz6jD9-_71TtxloVwDaQKUmcYv1O-fjTQPns-RcSkSquUAucZlvpjkFP-fVGT3tnEcdenBaE5VVF-C5Q";
+
+// Headers are the same for every chat request, so build them once
+const CHAT_REQUEST_HEADERS = {
+  'Content-Type': 'application/json',
+  'Authorization': `Bearer ${BEARER_TOKEN}`,
+  'accept': 'application/json'
+};
+
+// Rate limiting, server errors and dropped connections are retried with exponential backoff.
+// 504 is not retried: it means a long-running LLM call already timed out once.
+const RETRYABLE_STATUSES = new Set([429, 500, 502, 503]);
+const MAX_RETRIES = 3;
+const RETRY_BACKOFF_MS = 800;
+// Give up instead of waiting longer than this before a single retry
+const MAX_RETRY_DELAY_MS = 10000;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Retry-After is either a number of seconds or an HTTP date; null if absent or unreadable
+const getRetryAfterMs = (response) => {
+  const retryAfter = response.headers.get('Retry-After');
+  if (!retryAfter) return null;
+  const seconds = Number(retryAfter);
+  if (!Number.isNaN(seconds)) return Math.max(0, seconds * 1000);
+  const date = Date.parse(retryAfter);
+  return Number.isNaN(date) ? null : Math.max(0, date - Date.now());
+};
+
+const fetchWithRetry = async (url, options) => {
+  for (let attempt = 0; ; attempt++) {
+    let delay = RETRY_BACKOFF_MS * 2 ** attempt;
+    try {
+      const response = await fetch(url, options);
+      if (!RETRYABLE_STATUSES.has(response.status) || attempt >= MAX_RETRIES) {
+        return response;
+      }
+      if (response.status === 429) {
+        delay = getRetryAfterMs(response) ?? delay;
+      }
+      if (delay > MAX_RETRY_DELAY_MS) {
+        return response;
+      }
+      // Release the connection instead of leaving the unread body to garbage collection
+      await response.body?.cancel();
+    } catch (err) {
+      // fetch only rejects on network failures
+      if (attempt >= MAX_RETRIES) throw err;
+    }
+    await sleep(delay);
+  }
+};
+
+// Patterns used when formatting bot responses, compiled once
+const CELL_DELIMITER_PATTERN = /[,\t]|\s{2,}/;
+const NUMERIC_CELL_PATTERN = /^\d+(\.\d+)?$/;
+const PIPE_PATTERN = /\|/g;
+// Only dashes and colons once pipes and surrounding whitespace are removed, e.g. |---|:--:|
+const SEPARATOR_ROW_PATTERN = /^[-:]*$/;
+const COMMA_PATTERN = /,/;
+const TAB_PATTERN = /\t/;
+const MULTI_SPACE_PATTERN = /\s{2,}/;
+const NUMBERED_ITEM_PATTERN = /^\d+\.\s/;
+const HEADING_PATTERN = /^(#{1,3}) /;
+const BOLD_PATTERN = /\*\*(.*?)\*\*/g;
+const ITALIC_PATTERN = /\*(.*?)\*/g;
+
+// Avatar shown next to each message type; anything else is treated as an error
+const MESSAGE_AVATARS = { user: '👤', bot: '🤖', error: '⚠️' };
+
+// Answers to identical queries are reused for an hour instead of calling the API again.
+// Map keeps insertion order, so the first key is always the least recently used one.
+const RESPONSE_CACHE_TTL_MS = 60 * 60 * 1000;
+const RESPONSE_CACHE_MAX_ENTRIES = 50;
+const responseCache = new Map();
+
+const getCachedResponse = (key) => {
+  const entry = responseCache.get(key);
+  if (!entry) return null;
+  if (Date.now() - entry.timestamp > RESPONSE_CACHE_TTL_MS) {
+    responseCache.delete(key);
+    return null;
+  }
+  // Move the entry to the most recently used end
+  responseCache.delete(key);
+  responseCache.set(key, entry);
+  return entry.data;
+};
+
+const setCachedResponse = (key, data) => {
+  responseCache.delete(key);
+  responseCache.set(key, { data, timestamp: Date.now() });
+  if (responseCache.size > RESPONSE_CACHE_MAX_ENTRIES) {
+    responseCache.delete(responseCache.keys().next().value);
+  }
+};
+
+// Queries differing only in spacing share a cache entry; case is kept because it
+// can carry meaning (e.g. "CAR policy" is Contractor's All Risk, not a car policy)
+const WHITESPACE_RUN_PATTERN = /\s+/g;
+const getCacheKey = (query) => `${SPACE_NAME}|${query.trim().replace(WHITESPACE_RUN_PATTERN, ' ')}`;
+
+// Message objects are never mutated once added, so their rendered output is
+// remembered instead of being re-parsed on every render (e.g. each keystroke)
+const formattedMessageCache = new WeakMap();
+
+// Message formatting functions
+const formatMessage = (message) => {
+  if (!message || !message.content) return null;
+  
+  const cached = formattedMessageCache.get(message);
+  if (cached) return cached;
+  
+  const content = message.content;
+  
+  // Check if the content contains table data
+  const hasTable = detectTableInText(content);
+  
+  // Render the content
+  const formattedContent = hasTable 
+    ? renderFormattedTable(content) 
+    : formatRegularText(content);
+  
+  // Render source documents if they exist
+  const sourcesContent = message.sources ? renderSourceDocuments(message.sources) : null;
+  
+  const formatted = (
+    <div className="message-full-content">
+      <div className="message-content">
+        {formattedContent}
+      </div>
+      {sourcesContent}
+    </div>
+  );
+  formattedMessageCache.set(message, formatted);
+  return formatted;
+};
+
+// New function to render source documents
+const renderSourceDocuments = (sources) => {
+  if (!sources || Object.keys(sources).length === 0) return null;
+  
+  return (
+    <div className="source-documents">
+      <h4 className="sources-title">Sources:</h4>
+      <ul className="sources-list">
+        {Object.entries(sources).map(([key, value], index) => (
+          <li key={index} className="source-item">
+            <strong>{key}:</strong> {typeof value === 'object' ? JSON.stringify(value) : value}
+          </li>
+        ))}
+      </ul>
+    </div>
+  );
+};
+
+const detectTableInText = (text) => {
+  // Check for markdown tables (any pipe in the text is on some line)
+  if (text.includes('|')) {
+    return true;
+  }
+  
+  // Single-line answers cannot hold a header row plus data, so skip the scan
+  if (!text.includes('\n')) {
+    return false;
+  }
+  
+  // Check for CSV-like data
+  const lines = text.split('\n').filter(line => line.trim());
+  if (lines.length >= 2) {
+    // Check if multiple lines have the same number of delimiters (comma, tab, or multiple spaces)
+    const firstLineItems = lines[0].split(CELL_DELIMITER_PATTERN).filter(item => item.trim());
+    const secondLineItems = lines[1].split(CELL_DELIMITER_PATTERN).filter(item => item.trim());
+    
+    if (firstLineItems.length >= 2 && firstLineItems.length === secondLineItems.length) {
+      // Check if at least one line has numeric content
+      return lines.some(line => 
+        line.split(CELL_DELIMITER_PATTERN).some(item => NUMERIC_CELL_PATTERN.test(item.trim()))
+      );
+    }
+  }
+  
+  return false;
+};
+
+const renderFormattedTable = (text) => {
+  // Split into lines and remove empty ones
+  const lines = text.split('\n').filter(line => line.trim());
+  
+  // Handle markdown tables
+  if (text.includes('|')) {
+    return renderMarkdownTable(lines);
+  }
+  
+  // Handle CSV or space-separated tables
+  return renderDelimitedTable(lines);
+};
+
+const renderMarkdownTable = (lines) => {
+  // Extract table lines
+  const tableLines = lines.filter(line => line.includes('|'));
+  const textBeforeTable = lines.slice(0, lines.indexOf(tableLines[0])).join('\n');
+  
+  // Extract headers
+  const headerLine = tableLines[0];
+  let headers = headerLine
+    .split('|')
+    .map(h => h.trim())
+    .filter(h => h !== '');
+  
+  // Skip separator line if present
+  const separatorIndex = tableLines.findIndex(line => 
+    line.includes('|') && SEPARATOR_ROW_PATTERN.test(line.replace(PIPE_PATTERN, '').trim())
+  );
+  
+  const dataStartIndex = separatorIndex > 0 ? separatorIndex + 1 : 1;
+  
+  // Extract data rows
+  const rows = tableLines.slice(dataStartIndex).map(line => 
+    line.split('|')
+      .map(cell => cell.trim())
+      .filter(cell => cell !== '')
+  );
+  
+  return (
+    <div>
+      {textBeforeTable && <div className="text-before-table">{textBeforeTable}</div>}
+      <div className="table-container">
+        <table className="data-table">
+          <thead>
+            <tr>
+              {headers.map((header, index) => (
+                <th key={index}>{header}</th>
+              ))}
+            </tr>
+          </thead>
+          <tbody>
+            {rows.map((row, rowIndex) => (
+              <tr key={rowIndex}>
+                {row.map((cell, cellIndex) => (
+                  <td key={cellIndex}>
+                    {isNaN(Number(cell)) ? cell : Number(cell).toLocaleString()}
+                  </td>
+                ))}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    </div>
+  );
+};
+
+const renderDelimitedTable = (lines) => {
+  // Determine delimiter
+  let delimiter = COMMA_PATTERN;
+  if (lines[0].includes('\t')) {
+    delimiter = TAB_PATTERN;
+  } else if (!lines[0].includes(',') && MULTI_SPACE_PATTERN.test(lines[0])) {
+    delimiter = MULTI_SPACE_PATTERN;
+  }
+  
+  // Extract headers and data
+  const headers = lines[0].split(delimiter).map(h => h.trim());
+  const rows = lines.slice(1).map(line => 
+    line.split(delimiter).map(cell => cell.trim())
+  );
+  
+  return (
+    <div className="table-container">
+      <table className="data-table">
+        <thead>
+          <tr>
+            {headers.map((header, index) => (
+              <th key={index}>{header}</th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          {rows.map((row, rowIndex) => (
+            <tr key={rowIndex}>
+              {row.map((cell, cellIndex) => (
+                <td key={cellIndex}>
+                  {isNaN(Number(cell)) ? cell : Number(cell).toLocaleString()}
+                </td>
+              ))}
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  );
+};
+
+const formatRegularText = (text) => {
+  // Process text with better markdown handling
+  const paragraphs = text.split('\n');
+  
+  // Track if we're in a code block or list
+  let inCodeBlock = false;
+  let currentCodeContent = '';
+  let formattedContent = [];
+  
+  paragraphs.forEach((paragraph, idx) => {
+    // Handle code blocks
+    if (paragraph.startsWith('```') || inCodeBlock) {
+      if (paragraph.startsWith('```')) {
+        if (inCodeBlock) {
+          // End of code block
+          formattedContent.push(
+            <pre key={`code-${idx}`} className="code-block">
+              <code>{currentCodeContent}</code>
+            </pre>
+          );
+          currentCodeContent = '';
+          inCodeBlock = false;
+        } else {
+          // Start of code block
+          inCodeBlock = true;
+        }
+      } else if (inCodeBlock) {
+        // Content inside code block
+        currentCodeContent += paragraph + '\n';
+      }
+      return;
+    }
+    
+    const trimmed = paragraph.trim();
+    
+    // Handle bullet points
+    if (trimmed.startsWith('- ') || trimmed.startsWith('* ')) {
+      formattedContent.push(
+        <ul key={`ul-${idx}`} className="bullet-list">
+          <li>{trimmed.substring(2)}</li>
+        </ul>
+      );
+      return;
+    }
+    
+    // Handle numbered lists
+    if (NUMBERED_ITEM_PATTERN.test(trimmed)) {
+      formattedContent.push(
+        <ol key={`ol-${idx}`} className="numbered-list">
+          <li>{trimmed.replace(NUMBERED_ITEM_PATTERN, '')}</li>
+        </ol>
+      );
+      return;
+    }
+    
+    // Handle headings (#, ## and ###)
+    const headingMatch = HEADING_PATTERN.exec(paragraph);
+    if (headingMatch) {
+      const level = headingMatch[1].length;
+      const Heading = `h${level}`;
+      formattedContent.push(
+        <Heading key={`h${level}-${idx}`} className={`heading-${level}`}>
+          {paragraph.substring(level + 1)}
+        </Heading>
+      );
+      return;
+    }
+    
+    // Handle bold and italic text
+    if (trimmed) {
+      // Most lines have no asterisk at all, so check that before running the regexes
+      let processedText = paragraph;
+      if (processedText.includes('*')) {
+        // Replace **bold** with <strong>bold</strong>
+        processedText = processedText.replace(BOLD_PATTERN, '<strong>$1</strong>');
+        // Replace *italic* with <em>italic</em>
+        processedText = processedText.replace(ITALIC_PATTERN, '<em>$1</em>');
+      }
+      
+      formattedContent.push(
+        <p 
+          key={`p-${idx}`} 
+          dangerouslySetInnerHTML={{ __html: processedText }} 
+          className="paragraph"
+        />
+      );
+    } else if (paragraph === '') {
+      // Add spacing for empty lines
+      formattedContent.push(<div key={`space-${idx}`} className="spacer"></div>);
+    }
+  });
+  
+  // Handle any remaining code block content
+  if (inCodeBlock && currentCodeContent) {
+    formattedContent.push(
+      <pre key="code-final" className="code-block">
+        <code>{currentCodeContent}</code>
+      </pre>
+    );
+  }
+  
+  return <div>{formattedContent}</div>;
+};
+
 const ChatApplication = () => {
   const [query, setQuery] = useState('');
   const [messages, setMessages] = useState([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
   const messagesEndRef = useRef(null);
+  // Cache key of the previous question; asking it again fetches a fresh answer
+  const lastCacheKeyRef = useRef(null);
 
-  // Fixed values for the API call
-  const spaceNameValue = "Insurance_usecase";
-
-  // Get bearer token from CanvasAI
-  const bearerToken = "eyJhbGciOiJSUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6ICIyNzJza204SEFYVEl1MWgwNThyZUliVVJILWhLTEE5OElFOHdqMDlyXzJNIn0.eyJleHAiOjE3NDEwNzM1ODMsImlhdCI6MTc0MTA3MjA4MywiYXV0aF90aW1lIjoxNzQxMDY5MTkyLCJqdGkiOiI2NzEyYjFhNy1mMzBmLTQyMmQtOTFhNS1hY2VjMzFjMWE4MzYiLCJpc3MiOiJodHRwczovL2xudGNzLmFpL2tleWNsb2FrL3JlYWxtcy9jYW52YXNhaSIsImF1ZCI6ImJyb2tlciIsInN1YiI6ImQwNTkxZDg4LWUyYTEtNGE1OC1hODYxLWNiMTRjZTQ3NjJiZiIsInR5cCI6IkJlYXJlciIsImF6cCI6ImNhbnZhc2FpLWNvbnRyb2xwbGFuZS11aSIsIm5vbmNlIjoiODNhZDZiNWYtNDY4NC00NTA2LThhNGQtZmU2MmJjNjI5ZjYxIiwic2Vzc2lvbl9zdGF0ZSI6IjhhMjBmN2FjLWUyOTgtNDg4Ni1iMjZhLWVjNmE5NWNmNjE3ZCIsImFjciI6IjEiLCJhbGxvd2VkLW9yaWdpbnMiOlsiKiIsImh0dHBzOi8vbG50Y3MuYWkvc3R1ZGlvIl0sInJlc291cmNlX2FjY2VzcyI6eyJicm9rZXIiOnsicm9sZXMiOlsicmVhZC10b2tlbiJdfX0sInNjb3BlIjoib3BlbmlkIGVtYWlsIEdyb3VwU2NvcGUgcHJvZmlsZSIsInNpZCI6IjhhMjBmN2FjLWUyOTgtNDg4Ni1iMjZhLWVjNmE5NWNmNjE3ZCIsInVwbiI6ImVmZDI4MWFhLTUyM2EtNDhjNS1iZjY3LWE5ZmQzYTQ4ZmZiYiIsImVtYWlsX3ZlcmlmaWVkIjp0cnVlLCJuYW1lIjoiQW5hcyBTYWhlYiIsImdyb3VwcyI6WyIvY2FudmFzYWktYWRtaW4iLCIvY2FudmFzYWktY3JlYXRvciJdLCJwcmVmZXJyZWRfdXNlcm5hbWUiOiJlZmQyODFhYS01MjNhLTQ4YzUtYmY2Ny1hOWZkM2E0OGZmYmIiLCJnaXZlbl9uYW1lIjoiQW5hcyIsImZhbWlseV9uYW1lIjoiU2FoZWIiLCJlbWFpbCI6ImFuYXMuc2FoZWItY250QGxudGVjYy5jb20ifQ.OgbldflbcGQdrUC-cYw3sRUQDxpvSY4oLtRhOwguC5PlCHgF04Kw7u6WMD0fVGdfqT2IVdbdhmffhptsp7F9WsxXwB2Ryiygwyg4kEwEuwyFcMvI4r1ByQWCCxCiVmTeGYtWzdmmfabti8Q0NppOkya2Z6WP_BLLypj3tKdJRCuLjWsSsk1lhnKSM_FXBu0t-lxw8a5_XBzFrjmLezFbu2vK7QMomMH2jUCCNHGY9Cd7wSCwUMEjojXmQWZcksInD8CiZJmz6jD9-_71TtxloVwDaQKUmcYv1O-fjTQPns-RcSkSquUAucZlvpjkFP-fVGT3tnEcdenBaE5VVF-C5Q";
   // Auto-scroll to bottom when messages change
   useEffect(() => {
     scrollToBottom();
@@ -34,32 +435,40 @@ const ChatApplication = () => {
     setLoading(true);
     setError(null);
     
+    const cacheKey = getCacheKey(query);
+    const isRepeatOfLastQuery = cacheKey === lastCacheKeyRef.current;
+    lastCacheKeyRef.current = cacheKey;
+    
     try {
-      const response = await fetch('https://lntcs.ai/chatservice/chat', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${bearerToken}`,
-          'accept': 'application/json'
-        },
-        body: JSON.stringify({
-          query: query,
-          space_name: spaceNameValue,
-          userId: "anonymous", // Replace with a default value instead of userProfile
-          hint: "Act as an expert attorney specializing in insurance clauses for large-scale construction projects. You have extensive experience in analyzing tender documents and policy documents to extract relevant insurance obligations.Instructions:Extract clauses only related to the above categories.The extracted text should be directly from the tender or policy document.If summarization is needed!, provide a context-based summarization without altering the legal meaning.",
-          //flow_name: "clause_generation",  // Added flow_name parameter
-          //embedding_metadata: {            // Added embedding_metadata parameter
-          //  "file_name": "Proposal_Form_by_Ins_Dept.pdf"
-          //}
-        })
-      });
+      let data = isRepeatOfLastQuery ? null : getCachedResponse(cacheKey);
       
-      if (!response.ok) {
-        throw new Error(`Error: ${response.status} ${response.statusText}`);
+      if (!data) {
+        const response = await fetchWithRetry(CHAT_API_URL, {
+          method: 'POST',
+          headers: CHAT_REQUEST_HEADERS,
+          body: JSON.stringify({
+            query: query,
+            space_name: SPACE_NAME,
+            userId: "anonymous", // Replace with a default value instead of userProfile
+            hint: EXTRACTION_HINT,
+            //flow_name: "clause_generation",  // Added flow_name parameter
+            //embedding_metadata: {            // Added embedding_metadata parameter
+            //  "file_name": "Proposal_Form_by_Ins_Dept.pdf"
+            //}
+          })
+        });
+        
+        if (!response.ok) {
+          throw new Error(`Error: ${response.status} ${response.statusText}`);
+        }
+        
+        data = await response.json();
+        // Don't replay error payloads or empty answers from the cache
+        if (typeof data.response === 'string' && data.response.trim()) {
+          setCachedResponse(cacheKey, data);
+        }
       }
       
-      const data = await response.json();
-      
       // Add bot response to chat with source information
       const botMessage = { 
         type: 'bot', 
@@ -89,286 +498,6 @@ const ChatApplication = () => {
     window.location.href = "https://lntcs.ai/app";
   };
 
-  // Message formatting functions
-  const formatMessage = (message) => {
-    if (!message || !message.content) return null;
-    
-    const content = message.content;
-    
-    // Check if the content contains table data
-    const hasTable = detectTableInText(content);
-    
-    // Render the content
-    const formattedContent = hasTable 
-      ? renderFormattedTable(content) 
-      : formatRegularText(content);
-    
-    // Render source documents if they exist
-    const sourcesContent = message.sources ? renderSourceDocuments(message.sources) : null;
-    
-    return (
-      <div className="message-full-content">
-        <div className="message-content">
-          {formattedContent}
-        </div>
-        {sourcesContent}
-      </div>
-    );
-  };
-
-  // New function to render source documents
-  const renderSourceDocuments = (sources) => {
-    if (!sources || Object.keys(sources).length === 0) return null;
-    
-    return (
-      <div className="source-documents">
-        <h4 className="sources-title">Sources:</h4>
-        <ul className="sources-list">
-          {Object.entries(sources).map(([key, value], index) => (
-            <li key={index} className="source-item">
-              <strong>{key}:</strong> {typeof value === 'object' ? JSON.stringify(value) : value}
-            </li>
-          ))}
-        </ul>
-      </div>
-    );
-  };
-
-  const detectTableInText = (text) => {
-    // Check for markdown tables
-    if (text.includes('|') && text.split('\n').some(line => line.includes('|'))) {
-      return true;
-    }
-    
-    // Check for CSV-like data
-    const lines = text.split('\n').filter(line => line.trim());
-    if (lines.length >= 2) {
-      // Check if multiple lines have the same number of delimiters (comma, tab, or multiple spaces)
-      const firstLineItems = lines[0].split(/[,\t]|\s{2,}/).filter(item => item.trim());
-      const secondLineItems = lines[1].split(/[,\t]|\s{2,}/).filter(item => item.trim());
-      
-      if (firstLineItems.length >= 2 && firstLineItems.length === secondLineItems.length) {
-        // Check if at least one line has numeric content
-        return lines.some(line => 
-          line.split(/[,\t]|\s{2,}/).some(item => /^\d+(\.\d+)?$/.test(item.trim()))
-        );
-      }
-    }
-    
-    return false;
-  };
-
-  const renderFormattedTable = (text) => {
-    // Split into lines and remove empty ones
-    const lines = text.split('\n').filter(line => line.trim());
-    
-    // Handle markdown tables
-    if (text.includes('|')) {
-      return renderMarkdownTable(lines);
-    }
-    
-    // Handle CSV or space-separated tables
-    return renderDelimitedTable(lines);
-  };
-
-  const renderMarkdownTable = (lines) => {
-    // Extract table lines
-    const tableLines = lines.filter(line => line.includes('|'));
-    const textBeforeTable = lines.slice(0, lines.indexOf(tableLines[0])).join('\n');
-    
-    // Extract headers
-    const headerLine = tableLines[0];
-    let headers = headerLine
-      .split('|')
-      .map(h => h.trim())
-      .filter(h => h !== '');
-    
-    // Skip separator line if present
-    const separatorIndex = tableLines.findIndex(line => 
-      line.includes('|') && line.replace(/\|/g, '').trim().replace(/[^-:]/g, '') === line.replace(/\|/g, '').trim()
-    );
-    
-    const dataStartIndex = separatorIndex > 0 ? separatorIndex + 1 : 1;
-    
-    // Extract data rows
-    const rows = tableLines.slice(dataStartIndex).map(line => 
-      line.split('|')
-        .map(cell => cell.trim())
-        .filter(cell => cell !== '')
-    );
-    
-    return (
-      <div>
-        {textBeforeTable && <div className="text-before-table">{textBeforeTable}</div>}
-        <div className="table-container">
-          <table className="data-table">
-            <thead>
-              <tr>
-                {headers.map((header, index) => (
-                  <th key={index}>{header}</th>
-                ))}
-              </tr>
-            </thead>
-            <tbody>
-              {rows.map((row, rowIndex) => (
-                <tr key={rowIndex}>
-                  {row.map((cell, cellIndex) => (
-                    <td key={cellIndex}>
-                      {isNaN(Number(cell)) ? cell : Number(cell).toLocaleString()}
-                    </td>
-                  ))}
-                </tr>
-              ))}
-            </tbody>
-          </table>
-        </div>
-      </div>
-    );
-  };
-
-  const renderDelimitedTable = (lines) => {
-    // Determine delimiter
-    let delimiter = /,/;
-    if (lines[0].includes('\t')) {
-      delimiter = /\t/;
-    } else if (!lines[0].includes(',') && lines[0].match(/\s{2,}/)) {
-      delimiter = /\s{2,}/;
-    }
-    
-    // Extract headers and data
-    const headers = lines[0].split(delimiter).map(h => h.trim());
-    const rows = lines.slice(1).map(line => 
-      line.split(delimiter).map(cell => cell.trim())
-    );
-    
-    return (
-      <div className="table-container">
-        <table className="data-table">
-          <thead>
-            <tr>
-              {headers.map((header, index) => (
-                <th key={index}>{header}</th>
-              ))}
-            </tr>
-          </thead>
-          <tbody>
-            {rows.map((row, rowIndex) => (
-              <tr key={rowIndex}>
-                {row.map((cell, cellIndex) => (
-                  <td key={cellIndex}>
-                    {isNaN(Number(cell)) ? cell : Number(cell).toLocaleString()}
-                  </td>
-                ))}
-              </tr>
-            ))}
-          </tbody>
-        </table>
-      </div>
-    );
-  };
-
-  const formatRegularText = (text) => {
-    // Process text with better markdown handling
-    const paragraphs = text.split('\n');
-    
-    // Track if we're in a code block or list
-    let inCodeBlock = false;
-    let currentCodeContent = '';
-    let formattedContent = [];
-    
-    paragraphs.forEach((paragraph, idx) => {
-      // Handle code blocks
-      if (paragraph.startsWith('```') || inCodeBlock) {
-        if (paragraph.startsWith('```')) {
-          if (inCodeBlock) {
-            // End of code block
-            formattedContent.push(
-              <pre key={`code-${idx}`} className="code-block">
-                <code>{currentCodeContent}</code>
-              </pre>
-            );
-            currentCodeContent = '';
-            inCodeBlock = false;
-          } else {
-            // Start of code block
-            inCodeBlock = true;
-          }
-        } else if (inCodeBlock) {
-          // Content inside code block
-          currentCodeContent += paragraph + '\n';
-        }
-        return;
-      }
-      
-      // Handle bullet points
-      if (paragraph.trim().startsWith('- ') || paragraph.trim().startsWith('* ')) {
-        formattedContent.push(
-          <ul key={`ul-${idx}`} className="bullet-list">
-            <li>{paragraph.trim().substring(2)}</li>
-          </ul>
-        );
-        return;
-      }
-      
-      // Handle numbered lists
-      if (/^\d+\.\s/.test(paragraph.trim())) {
-        formattedContent.push(
-          <ol key={`ol-${idx}`} className="numbered-list">
-            <li>{paragraph.trim().replace(/^\d+\.\s/, '')}</li>
-          </ol>
-        );
-        return;
-      }
-      
-      // Handle headings
-      if (paragraph.startsWith('# ')) {
-        formattedContent.push(<h1 key={`h1-${idx}`} className="heading-1">{paragraph.substring(2)}</h1>);
-        return;
-      }
-      
-      if (paragraph.startsWith('## ')) {
-        formattedContent.push(<h2 key={`h2-${idx}`} className="heading-2">{paragraph.substring(3)}</h2>);
-        return;
-      }
-      
-      if (paragraph.startsWith('### ')) {
-        formattedContent.push(<h3 key={`h3-${idx}`} className="heading-3">{paragraph.substring(4)}</h3>);
-        return;
-      }
-      
-      // Handle bold and italic text
-      if (paragraph.trim()) {
-        // Replace **bold** with <strong>bold</strong>
-        let processedText = paragraph;
-        processedText = processedText.replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>');
-        // Replace *italic* with <em>italic</em>
-        processedText = processedText.replace(/\*(.*?)\*/g, '<em>$1</em>');
-        
-        formattedContent.push(
-          <p 
-            key={`p-${idx}`} 
-            dangerouslySetInnerHTML={{ __html: processedText }} 
-            className="paragraph"
-          />
-        );
-      } else if (paragraph === '') {
-        // Add spacing for empty lines
-        formattedContent.push(<div key={`space-${idx}`} className="spacer"></div>);
-      }
-    });
-    
-    // Handle any remaining code block content
-    if (inCodeBlock && currentCodeContent) {
-      formattedContent.push(
-        <pre key="code-final" className="code-block">
-          <code>{currentCodeContent}</code>
-        </pre>
-      );
-    }
-    
-    return <div>{formattedContent}</div>;
-  };
-
   return (
     <div className="chat-application">
       <div className="chat-header">
@@ -406,7 +535,7 @@ const ChatApplication = () => {
                 className={`message ${message.type}-message`}
               >
                 <div className="message-avatar">
-                  {message.type === 'user' ? '👤' : message.type === 'bot' ? '🤖' : '⚠️'}
+                  {MESSAGE_AVATARS[message.type] || MESSAGE_AVATARS.error}
                 </div>
                 <div className="message-bubble">
                   {formatMessage(message)}
@@ -416,7 +545,7 @@ const ChatApplication = () => {
           )}
           {loading && (
             <div className="message bot-message">
-              <div className="message-avatar">🤖</div>
+              <div className="message-avatar">{MESSAGE_AVATARS.bot}</div>
               <div className="message-bubble">
                 <div className="typing-indicator">
                   <span></span>